@@ -1,7 +1,36 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Iterable, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from numbers import Integral
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+try:
+    import pandas as pd  # type: ignore
+    HAS_PANDAS = True
+except ImportError:
+    pd = None
+    HAS_PANDAS = False
+
+try:
+    from gemm_kernels import fp8fp8_tile_metrics_c
+except ImportError:  # extension not built, use the Python model
+    fp8fp8_tile_metrics_c = None
+
+# The compiled and batch models work in int64; past this size the products of
+# three tile sizes no longer fit in 64 bits, so larger tiles use the exact Python model
+C_TILE_LIMIT = 1 << 20
+
+__all__ = [
+    "HAS_PANDAS",
+    "ROW_ORDER",
+    "TileConfig",
+    "fp8fp8_tile_metrics",
+    "fp8fp8_tile_metrics_batch",
+    "fp8fp8_table",
+]
 
 # ---------- FP8xFP8 GEMM tile model (matches the screenshot table) ----------
 
@@ -11,16 +40,27 @@ LDS_CAP_BYTES = 320 * 1024  # 320 KiB (gives 7.57 and 4.25 in the screenshot)
 LDS_BYTES_PER_CYCLE = 128   # used for "lds time" rows
 F8_MFMA_THROUGHPUT = 16 * 16 * 128 / 8
 
+# Row order of the metrics vector returned by fp8fp8_tile_metrics
+ROW_ORDER = (
+    "tilem", "tilen", "tilek",
+    "compute cycles",
+    "A lds", "B lds", "scale", "Total lds",
+    "lds a inst", "lds b inst", "lds scale inst",
+    "max lds stage", "wave lds latency time",
+    "TDM A", "TDM B", "TDM issue time",
+    "acc reg", "a regs", "b regs", "reg per msb",
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TileConfig:
     m: int
     n: int
     k: int
+    name: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def name(self) -> str:
-        return f"{self.m}x{self.n}x{self.k}"
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name", f"{self.m}x{self.n}x{self.k}")
 
 
 def _require_divisible(x: int, d: int, what: str) -> None:
@@ -28,11 +68,12 @@ def _require_divisible(x: int, d: int, what: str) -> None:
         raise ValueError(f"{what} must be divisible by {d}, got {x}")
 
 
-def fp8fp8_tile_metrics(tile_m: int, tile_n: int, tile_k: int) -> Dict[str, Optional[float]]:
-    """Compute the table metrics from (tilem, tilen, tilek) for FP8xFP8 GEMM."""
+def _fp8fp8_tile_metrics_py(tile_m: int, tile_n: int, tile_k: int) -> Tuple[float, ...]:
+    """Metrics for one tile, one value per row of ``ROW_ORDER``."""
 
     _require_divisible(tile_k, 32, "tile_k")
     _require_divisible(tile_n, 16, "tile_n")
+    _require_divisible(tile_m, 8, "tile_m")
 
     # LDS usage (bytes)
     a_lds = tile_m * (tile_k + A_LDS_PAD)         # matches 64*(128+16)=9216
@@ -45,7 +86,7 @@ def fp8fp8_tile_metrics(tile_m: int, tile_n: int, tile_k: int) -> Dict[str, Opti
 
     total_lds = a_lds + b_lds + scale
 
-    compute_cycles = tile_m * tile_n * tile_k / 4 / F8_MFMA_THROUGHPUT
+    compute_cycles = (tile_m * tile_n * tile_k) / (4 * F8_MFMA_THROUGHPUT)
 
     # TDM model 
     tdm_a = tile_m
@@ -54,67 +95,149 @@ def fp8fp8_tile_metrics(tile_m: int, tile_n: int, tile_k: int) -> Dict[str, Opti
 
     # Wave-level LDS + time (bytes/cycle)
     lds_a_inst = (tile_m * tile_k) // 512
-    lds_b_inst = (tile_n  / 4 * tile_k) // 512
-    lds_scale_inst = (tile_m * tile_k / 32  + tile_n * tile_k / 4 / 32) // 128
+    lds_b_inst = (tile_n // 4 * tile_k) // 512
+    lds_scale_inst = (tile_m * tile_k // 32 + tile_n * tile_k // 4 // 32) // 128
     lds_1x4 = a_lds + b_lds // 4
     lds_1x4_time = lds_1x4 / LDS_BYTES_PER_CYCLE
 
     # Register model rows (matches screenshot values for N=256/512)
-    acc_reg = tile_m * tile_n / 4 / 16 / 16 * 8
-    a_regs = tile_m * tile_k / 16 / 128 * 16
-    b_regs = tile_n  / 4 * tile_k / 16 / 128 * 16
+    acc_reg = (tile_m * tile_n * 8) // (4 * 16 * 16)
+    a_regs = (tile_m * tile_k * 16) // (16 * 128)
+    b_regs = (tile_n // 4 * tile_k * 16) // (16 * 128)
     reg_per_msb = acc_reg / 4 + max(a_regs, b_regs) / 2
 
-    return {
-        "tilem": tile_m,
-        "tilen": tile_n,
-        "tilek": tile_k,
-        "compute cycles": compute_cycles,
-        "A lds": a_lds,
-        "B lds": b_lds,
-        "scale": scale,
-        "Total lds": total_lds,
-        "lds a inst": lds_a_inst,
-        "lds b inst": lds_b_inst,
-        "lds scale inst": lds_scale_inst,
-        "max lds stage": LDS_CAP_BYTES / total_lds,
-        "wave lds latency time": lds_1x4_time,
-        "TDM A": tdm_a,
-        "TDM B": tdm_b,
-        "TDM issue time": tdm_issue_time,
-        "acc reg": acc_reg,
-        "a regs": a_regs,
-        "b regs": b_regs,
-        "reg per msb": reg_per_msb,
-    }
+    return (
+        tile_m, tile_n, tile_k,
+        compute_cycles,
+        a_lds, b_lds, scale, total_lds,
+        lds_a_inst, lds_b_inst, lds_scale_inst,
+        LDS_CAP_BYTES / total_lds, lds_1x4_time,
+        tdm_a, tdm_b, tdm_issue_time,
+        acc_reg, a_regs, b_regs, reg_per_msb,
+    )
+
+
+@lru_cache(maxsize=None, typed=True)
+def _fp8fp8_tile_metrics_tuple(tile_m, tile_n, tile_k):
+    # Prefer the compiled model from gemm_kernels.pyx when it has been built;
+    # it takes int64, so only hand it exact integers small enough not to overflow
+    if fp8fp8_tile_metrics_c is not None and all(
+        isinstance(x, Integral) and abs(x) <= C_TILE_LIMIT for x in (tile_m, tile_n, tile_k)
+    ):
+        return fp8fp8_tile_metrics_c(tile_m, tile_n, tile_k)
+    return _fp8fp8_tile_metrics_py(tile_m, tile_n, tile_k)
+
+
+def fp8fp8_tile_metrics(tile_m: int, tile_n: int, tile_k: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Compute the table metrics from (tilem, tilen, tilek) for FP8xFP8 GEMM.
+
+    Returns one value per row of ``ROW_ORDER``, written into ``out`` if given.
+    """
+
+    metrics = _fp8fp8_tile_metrics_tuple(tile_m, tile_n, tile_k)
+    if out is None:
+        return np.array(metrics, dtype=np.float64)
+    out[:] = metrics
+    return out
+
+
+def fp8fp8_tile_metrics_batch(
+    tile_m: np.ndarray,
+    tile_n: np.ndarray,
+    tile_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Vectorized ``fp8fp8_tile_metrics`` over arrays of tile sizes.
+
+    Returns an array of shape ``(len(ROW_ORDER), len(tile_m))``, written into
+    ``out`` if given.
+    """
+
+    tile_m = np.atleast_1d(np.asarray(tile_m))
+    tile_n = np.atleast_1d(np.asarray(tile_n))
+    tile_k = np.atleast_1d(np.asarray(tile_k))
+
+    if tile_m.ndim != 1 or tile_m.shape != tile_n.shape or tile_m.shape != tile_k.shape:
+        raise ValueError(
+            f"tile_m, tile_n and tile_k must be 1-D arrays of the same length, "
+            f"got shapes {tile_m.shape}, {tile_n.shape}, {tile_k.shape}"
+        )
+
+    # Check before the int64 cast so fractional sizes are rejected like the
+    # scalar model does instead of being truncated
+    for x, d, what in ((tile_k, 32, "tile_k"), (tile_n, 16, "tile_n"), (tile_m, 8, "tile_m")):
+        bad = x % d != 0
+        if np.any(bad):
+            raise ValueError(f"{what} must be divisible by {d}, got {x[bad][0]}")
+
+    if any(np.any(np.abs(x) > C_TILE_LIMIT) for x in (tile_m, tile_n, tile_k)):
+        # int64 products would wrap, so compute each tile with the exact scalar model
+        cols = [
+            np.array(_fp8fp8_tile_metrics_tuple(m, n, k), dtype=np.float64)
+            for m, n, k in zip(tile_m.tolist(), tile_n.tolist(), tile_k.tolist())
+        ]
+        return np.stack(cols, axis=1, out=out)
+
+    tile_m = tile_m.astype(np.int64)
+    tile_n = tile_n.astype(np.int64)
+    tile_k = tile_k.astype(np.int64)
+
+    a_lds = tile_m * (tile_k + A_LDS_PAD)
+    b_lds = tile_k * tile_n
+
+    a_scale = np.floor_divide(tile_m * tile_k, BLOCK_SIZE)
+    b_scale = np.floor_divide(tile_n * tile_k, BLOCK_SIZE)
+    scale = a_scale + b_scale
+
+    total_lds = a_lds + b_lds + scale
+
+    compute_cycles = (tile_m * tile_n * tile_k) / (4 * F8_MFMA_THROUGHPUT)
+
+    tdm_a = tile_m
+    tdm_b = np.floor_divide(tile_n * tile_k, 256)
+    tdm_issue_time = tdm_a + tdm_b
+
+    lds_a_inst = np.floor_divide(tile_m * tile_k, 512)
+    lds_b_inst = np.floor_divide(tile_n // 4 * tile_k, 512)
+    lds_scale_inst = np.floor_divide(tile_m * tile_k // 32 + tile_n * tile_k // 4 // 32, 128)
+    lds_1x4 = a_lds + np.floor_divide(b_lds, 4)
+    lds_1x4_time = lds_1x4 / LDS_BYTES_PER_CYCLE
+
+    acc_reg = np.floor_divide(tile_m * tile_n * 8, 4 * 16 * 16)
+    a_regs = np.floor_divide(tile_m * tile_k * 16, 16 * 128)
+    b_regs = np.floor_divide(tile_n // 4 * tile_k * 16, 16 * 128)
+    reg_per_msb = acc_reg / 4 + np.maximum(a_regs, b_regs) / 2
+
+    return np.stack([
+        tile_m, tile_n, tile_k,
+        compute_cycles,
+        a_lds, b_lds, scale, total_lds,
+        lds_a_inst, lds_b_inst, lds_scale_inst,
+        LDS_CAP_BYTES / total_lds, lds_1x4_time,
+        tdm_a, tdm_b, tdm_issue_time,
+        acc_reg, a_regs, b_regs, reg_per_msb,
+    ], out=out)
 
 
 def fp8fp8_table(configs: Iterable[TileConfig]):
     """Build a "rows x configs" table."""
 
     configs = list(configs)
-    cols = {cfg.name: fp8fp8_tile_metrics(cfg.m, cfg.n, cfg.k) for cfg in configs}
-
-    row_order = [
-        "tilem", "tilen", "tilek",
-        "compute cycles",
-        "A lds", "B lds", "scale", "Total lds",
-        "lds a inst", "lds b inst", "lds scale inst",
-        "max lds stage", "wave lds latency time",
-        "TDM A", "TDM B", "TDM issue time",
-        "acc reg", "a regs", "b regs", "reg per msb",
-    ]
-
-    table = {row: {cfg.name: cols[cfg.name].get(row) for cfg in configs} for row in row_order}
-
-    try:
-        import pandas as pd  # type: ignore
-
-        df = pd.DataFrame(table).T
-        df.columns = [cfg.name for cfg in configs]
-        return df
-    except Exception:
-        return table
+    names = [cfg.name for cfg in configs]
+
+    if not HAS_PANDAS:
+        # keep the model's own int/float values per cell
+        cols = [_fp8fp8_tile_metrics_tuple(cfg.m, cfg.n, cfg.k) for cfg in configs]
+        return {row: {name: col[i] for name, col in zip(names, cols)} for i, row in enumerate(ROW_ORDER)}
+
+    out = np.empty((len(ROW_ORDER), len(configs)), dtype=np.float64)
+    fp8fp8_tile_metrics_batch(
+        np.array([cfg.m for cfg in configs]),
+        np.array([cfg.n for cfg in configs]),
+        np.array([cfg.k for cfg in configs]),
+        out=out,
+    )
+    return pd.DataFrame(out, index=list(ROW_ORDER), columns=names)
 
 
 if __name__ == "__main__":
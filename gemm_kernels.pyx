@@ -0,0 +1,65 @@
+# cython: language_level=3
+"""Compiled FP8xFP8 GEMM tile model, mirroring ``gemm._fp8fp8_tile_metrics_py``.
+
+Build in place with ``cythonize -i gemm_kernels.pyx``; ``gemm.py`` falls back
+to the pure Python model when the extension is not available.
+
+All arithmetic is done in 64-bit integers, which wrap silently once a
+product of three tile sizes no longer fits; ``gemm.py`` only calls in here
+for tile sizes up to ``gemm.C_TILE_LIMIT``.
+"""
+
+from libc.stdint cimport int64_t
+
+cdef int64_t BLOCK_SIZE = 32
+cdef int64_t A_LDS_PAD = 16
+cdef int64_t LDS_CAP_BYTES = 320 * 1024
+cdef double LDS_BYTES_PER_CYCLE = 128
+cdef double F8_MFMA_THROUGHPUT = 16 * 16 * 128 / 8
+
+
+cpdef tuple fp8fp8_tile_metrics_c(int64_t tile_m, int64_t tile_n, int64_t tile_k):
+    """Same rows as ``gemm.ROW_ORDER``, computed in typed locals."""
+
+    cdef int64_t a_lds, b_lds, scale, total_lds, tdm_a, tdm_b, tdm_issue_time
+    cdef int64_t lds_a_inst, lds_b_inst, lds_scale_inst, acc_reg, a_regs, b_regs
+    cdef double compute_cycles, lds_1x4_time, reg_per_msb
+
+    if tile_k % 32 != 0:
+        raise ValueError(f"tile_k must be divisible by 32, got {tile_k}")
+    if tile_n % 16 != 0:
+        raise ValueError(f"tile_n must be divisible by 16, got {tile_n}")
+    if tile_m % 8 != 0:
+        raise ValueError(f"tile_m must be divisible by 8, got {tile_m}")
+
+    with nogil:
+        a_lds = tile_m * (tile_k + A_LDS_PAD)
+        b_lds = tile_k * tile_n
+        scale = (tile_m * tile_k) // BLOCK_SIZE + (tile_n * tile_k) // BLOCK_SIZE
+        total_lds = a_lds + b_lds + scale
+
+        compute_cycles = <double>(tile_m * tile_n * tile_k) / (4 * F8_MFMA_THROUGHPUT)
+
+        tdm_a = tile_m
+        tdm_b = tile_n * tile_k // 256
+        tdm_issue_time = tdm_a + tdm_b
+
+        lds_a_inst = (tile_m * tile_k) // 512
+        lds_b_inst = (tile_n // 4 * tile_k) // 512
+        lds_scale_inst = (tile_m * tile_k // 32 + tile_n * tile_k // 4 // 32) // 128
+        lds_1x4_time = (a_lds + b_lds // 4) / LDS_BYTES_PER_CYCLE
+
+        acc_reg = (tile_m * tile_n * 8) // (4 * 16 * 16)
+        a_regs = (tile_m * tile_k * 16) // (16 * 128)
+        b_regs = (tile_n // 4 * tile_k * 16) // (16 * 128)
+        reg_per_msb = acc_reg / 4.0 + (a_regs if a_regs > b_regs else b_regs) / 2.0
+
+    return (
+        tile_m, tile_n, tile_k,
+        compute_cycles,
+        a_lds, b_lds, scale, total_lds,
+        lds_a_inst, lds_b_inst, lds_scale_inst,
+        LDS_CAP_BYTES / <double>total_lds, lds_1x4_time,
+        tdm_a, tdm_b, tdm_issue_time,
+        acc_reg, a_regs, b_regs, reg_per_msb,
+    )
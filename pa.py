@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Iterable, Optional
+import pa_model
+from pa_model import CostCoeffs
 
 # ---------- FP8xFP8 GEMM tile model (matches the screenshot table) ----------
 
@@ -11,98 +11,50 @@ WARP_SIZE = 64
 ISSUE_CYCLES = 4
 EXP_ISSUE_CYCLES = ISSUE_CYCLES * 4
 
+COEFFS = CostCoeffs(
+    mma_throughput=MMA_THROUGHPUT,
+    head_size=HEAD_SIZE,
+    warp_size=WARP_SIZE,
+    vop_rate=ISSUE_CYCLES,
+    exp_rate=EXP_ISSUE_CYCLES,
+    cvt_rate=ISSUE_CYCLES * 2,
+    # inter_max: ds_permute + ds_write + ds_read + max3
+    inter_max_base=250 + 84 + 112,
+    inter_max_per_qtile=4 / 2 / 16,
+    out_split=4,
+    # reshape s: ds_write_b32 + ds_read_b128
+    reshape_base=100,
+    reshape_rate=(8 + 32) / 4,
+)
 
 
 def gemm(qtile, kv_tile):
-    ops = qtile * kv_tile * HEAD_SIZE * 2 * 2
-    cycles = ops / MMA_THROUGHPUT
-    return cycles
+    return pa_model.gemm(qtile, kv_tile, COEFFS)
+
 
 def softmax(qtile, kv_tile, is_packed: bool = False):
-    s_elems = (qtile * kv_tile) / WARP_SIZE
-    
-    #dequant
-    dequant = (s_elems / 2 if is_packed else s_elems) * ISSUE_CYCLES
-    
-    # intra_max: max3
-    intra_max = (s_elems / 2) * ISSUE_CYCLES
-    
-    # inter_max: ds_permute + ds_write + ds_read + max3
-    inter_max = 250 + 84 + 112 + (qtile / 16) * 4 / 2
-    
-    # s = exp((s - max) * scale), fma + exp
-    fma = s_elems / 2 if is_packed else s_elems 
-    exp = s_elems
-    softmax_fma_exp = fma * ISSUE_CYCLES + exp * EXP_ISSUE_CYCLES
-    
-    # get sum
-    softmax_sum = (s_elems / 2 if is_packed else s_elems)* ISSUE_CYCLES
-    
-    # quant s
-    quant_scale = s_elems / 2 if is_packed else s_elems 
-    cvt = s_elems / 2 if is_packed else s_elems 
-    s_quant = quant_scale * ISSUE_CYCLES + cvt * ISSUE_CYCLES * 2
-    
-    # reshape s: ds_write_b32 + ds_read_b128
-    reshape_s = s_elems / 4 * 8 + 100 + s_elems / 4 * 32
-    
-    # recompute_output
-    out_elems = (qtile * HEAD_SIZE / 4) / WARP_SIZE
-    recompute_output = (out_elems / 2 if is_packed else out_elems) * 2 * ISSUE_CYCLES
-    
-    return {
-        "dequant": dequant,
-        "intra_max": intra_max,
-        "inter_max": inter_max,
-        "softmax_fma_exp": softmax_fma_exp,
-        "softmax_sum": softmax_sum,
-        "s_quant": s_quant,
-        "reshape_s": reshape_s,
-        "recompute_output": recompute_output,
-    }
+    return pa_model.softmax(qtile, kv_tile, COEFFS, is_packed)
+
+
+def softmax_total_fast(qtile, kv_tile, is_packed=False):
+    return pa_model.softmax_total_fast(qtile, kv_tile, COEFFS, is_packed)
+
+
+def total_cycles(qtile, kv_tile, is_packed=False, co_exe=False):
+    return pa_model.total_cycles(qtile, kv_tile, COEFFS, is_packed, co_exe)
+
+
+def softmax_vec(qtile, kv_tile, is_packed=False):
+    return pa_model.softmax_vec(qtile, kv_tile, COEFFS, is_packed)
 
 
 def print_performance_table(qtile, kv_tile, co_exe=False, is_packed=False):
     """打印性能分析表格"""
-    
-    if co_exe:
-        is_packed = False
-        
-    softmax_metrics = softmax(qtile, kv_tile, is_packed)
-    gemm_cycles = gemm(qtile, kv_tile)
-    
-    softmax_total = sum(softmax_metrics.values())
-    
-    # compute total cycles
-    tot_cycles = gemm_cycles + softmax_total
-    
-    # compute total cycles for coexecution
-    tot_cycles_coexe = gemm_cycles + (softmax_total - gemm_cycles * 3 / 4) / 2
-    
-    
-    # 打印表格
-    print("\n" + "=" * 60)
-    print(f"Performance Table: qtile={qtile}, kv_tile={kv_tile}, is_packed={is_packed}, co_exe={co_exe}")
-    print("=" * 60)
-    print(f"{'Component':<25} {'Cycles':<12}")
-    print("-" * 60)
-    
-    # GEMM
-    print(f"{'GEMM':<25} {gemm_cycles:<12.2f}")
-    
-    # Softmax各项
-    print(f"{'Softmax Total':<25} {softmax_total:<12.2f}")
-    
-    for name, value in softmax_metrics.items():
-        formatted_name = name.replace("_", " ").title()
-        print(f"  {formatted_name:<23} {value:<12.2f}")
-    
-    # total cycles
-    print(f"{'Total Cycles':<25} {tot_cycles:<12.2f}")
-    if co_exe:
-        print(f"{'Total Cycles for Coexecution':<25} {tot_cycles_coexe:<12.2f}")
-    
-    print("=" * 60)
+    pa_model.print_performance_table(qtile, kv_tile, COEFFS, co_exe, is_packed)
+
+
+def print_performance_sweep(qtiles, kv_tiles, co_exe=False, is_packed=False):
+    pa_model.print_performance_sweep(qtiles, kv_tiles, COEFFS, co_exe, is_packed)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+import numpy as np
+
+try:
+    from math import fma
+except ImportError:  # math.fma is new in Python 3.13
+    def fma(x, y, z):
+        return x * y + z
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, fall back to plain Python
+    def njit(*args, **kwargs):
+        def decorator(fn):
+            return fn
+        return decorator
+
+# ---------- Paged-attention cost model shared by every architecture ----------
+
+# coexecution: gemm + (softmax - gemm * 3 / 4) / 2 == 0.5 * softmax + 0.625 * gemm
+CO_EXE_GEMM_COEF = 0.625
+
+
+class SoftmaxMetrics(NamedTuple):
+    dequant: float
+    intra_max: float
+    inter_max: float
+    softmax_fma_exp: float
+    softmax_sum: float
+    s_quant: float
+    reshape_s: float
+    recompute_output: float
+
+
+@dataclass(frozen=True, slots=True)
+class CostCoeffs:
+    """Per-architecture rates of the model, in cycles per instruction."""
+
+    mma_throughput: float
+    head_size: int
+    warp_size: int
+    vop_rate: float
+    exp_rate: float
+    cvt_rate: float
+    inter_max_base: float
+    inter_max_per_qtile: float
+    out_split: int = 1
+    reshape_base: float = 0.0
+    reshape_rate: float = 0.0
+    # flat tuples handed to the njit kernels
+    gemm_params: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    params: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    affine: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        inv_warp_size = 1.0 / self.warp_size
+        out_rate = self.head_size / self.out_split * inv_warp_size * 2 * self.vop_rate
+
+        object.__setattr__(self, "gemm_params", (1.0 / self.mma_throughput, float(self.head_size)))
+        object.__setattr__(self, "params", tuple(float(x) for x in (
+            inv_warp_size, self.vop_rate, self.exp_rate, self.cvt_rate,
+            self.inter_max_base, self.inter_max_per_qtile,
+            self.head_size / self.out_split,
+            self.reshape_base, self.reshape_rate,
+        )))
+
+        # softmax_total is affine in (s_elems, qtile):
+        #   softmax_total = A * s_elems + B * qtile + C
+        # A: dequant + fma + softmax_sum + quant_scale scale with packing, intra_max does not
+        a_packed = self.vop_rate * (4 * 0.5 + 0.5) + self.exp_rate + 0.5 * self.cvt_rate + self.reshape_rate
+        a_unpacked = self.vop_rate * (4 + 0.5) + self.exp_rate + self.cvt_rate + self.reshape_rate
+        # B: inter_max + recompute_output
+        b_packed = self.inter_max_per_qtile + 0.5 * out_rate
+        b_unpacked = self.inter_max_per_qtile + out_rate
+        # C: fixed LDS overhead of inter_max and reshape_s
+        c = self.inter_max_base + self.reshape_base
+
+        object.__setattr__(self, "affine", tuple(float(x) for x in (
+            inv_warp_size, a_packed, a_unpacked, b_packed, b_unpacked, c,
+        )))
+
+    @property
+    def has_reshape(self) -> bool:
+        return bool(self.reshape_base or self.reshape_rate)
+
+
+@njit(cache=True, fastmath=True)
+def _gemm(qtile, kv_tile, inv_mma_throughput, head_size):
+    ops = qtile * kv_tile * head_size * 2 * 2
+    return ops * inv_mma_throughput
+
+
+# No fastmath on the accumulating kernels: it may reorder the running total
+@njit(cache=True)
+def _softmax_packed(qtile, kv_tile, params):
+    (inv_warp_size, vop_rate, exp_rate, cvt_rate,
+     inter_max_base, inter_max_per_qtile, out_lanes, reshape_base, reshape_rate) = params
+
+    s_elems = (qtile * kv_tile) * inv_warp_size
+    total = 0.0
+
+    #dequant
+    dequant = (s_elems * 0.5) * vop_rate
+    total += dequant
+
+    # intra_max: max3
+    intra_max = (s_elems * 0.5) * vop_rate
+    total += intra_max
+
+    # inter_max: cross-lane reduction
+    inter_max = inter_max_base + qtile * inter_max_per_qtile
+    total += inter_max
+
+    # s = exp((s - max) * scale), fma + exp
+    softmax_fma_exp = (s_elems * 0.5) * vop_rate + s_elems * exp_rate
+    total += softmax_fma_exp
+
+    # get sum
+    softmax_sum = (s_elems * 0.5) * vop_rate
+    total += softmax_sum
+
+    # quant s: scale + cvt
+    s_quant = (s_elems * 0.5) * vop_rate + (s_elems * 0.5) * cvt_rate
+    total += s_quant
+
+    # reshape s through LDS
+    reshape_s = s_elems * reshape_rate + reshape_base
+    total += reshape_s
+
+    # recompute_output
+    out_elems = (qtile * out_lanes) * inv_warp_size
+    recompute_output = (out_elems * 0.5) * 2 * vop_rate
+    total += recompute_output
+
+    return np.array([
+        dequant,
+        intra_max,
+        inter_max,
+        softmax_fma_exp,
+        softmax_sum,
+        s_quant,
+        reshape_s,
+        recompute_output,
+    ]), total
+
+
+@njit(cache=True)
+def _softmax_unpacked(qtile, kv_tile, params):
+    (inv_warp_size, vop_rate, exp_rate, cvt_rate,
+     inter_max_base, inter_max_per_qtile, out_lanes, reshape_base, reshape_rate) = params
+
+    s_elems = (qtile * kv_tile) * inv_warp_size
+    total = 0.0
+
+    #dequant
+    dequant = s_elems * vop_rate
+    total += dequant
+
+    # intra_max: max3
+    intra_max = (s_elems * 0.5) * vop_rate
+    total += intra_max
+
+    # inter_max: cross-lane reduction
+    inter_max = inter_max_base + qtile * inter_max_per_qtile
+    total += inter_max
+
+    # s = exp((s - max) * scale), fma + exp
+    softmax_fma_exp = s_elems * vop_rate + s_elems * exp_rate
+    total += softmax_fma_exp
+
+    # get sum
+    softmax_sum = s_elems * vop_rate
+    total += softmax_sum
+
+    # quant s: scale + cvt
+    s_quant = s_elems * vop_rate + s_elems * cvt_rate
+    total += s_quant
+
+    # reshape s through LDS
+    reshape_s = s_elems * reshape_rate + reshape_base
+    total += reshape_s
+
+    # recompute_output
+    out_elems = (qtile * out_lanes) * inv_warp_size
+    recompute_output = out_elems * 2 * vop_rate
+    total += recompute_output
+
+    return np.array([
+        dequant,
+        intra_max,
+        inter_max,
+        softmax_fma_exp,
+        softmax_sum,
+        s_quant,
+        reshape_s,
+        recompute_output,
+    ]), total
+
+
+@njit(cache=True, fastmath=True)
+def _softmax_total(qtile, kv_tile, affine, is_packed):
+    inv_warp_size, a_packed, a_unpacked, b_packed, b_unpacked, c = affine
+    s_elems = (qtile * kv_tile) * inv_warp_size
+    if is_packed:
+        return a_packed * s_elems + b_packed * qtile + c
+    return a_unpacked * s_elems + b_unpacked * qtile + c
+
+
+@njit(cache=True, fastmath=True)
+def _total_cycles(qtile, kv_tile, gemm_params, affine, is_packed, co_exe):
+    gemm_cycles = _gemm(qtile, kv_tile, gemm_params[0], gemm_params[1])
+    if co_exe:
+        # coexecution runs the unpacked softmax
+        return CO_EXE_GEMM_COEF * gemm_cycles + 0.5 * _softmax_total(qtile, kv_tile, affine, False)
+    return gemm_cycles + _softmax_total(qtile, kv_tile, affine, is_packed)
+
+
+def gemm(qtile, kv_tile, coeffs: CostCoeffs):
+    return _gemm(qtile, kv_tile, coeffs.gemm_params[0], coeffs.gemm_params[1])
+
+
+def softmax(qtile, kv_tile, coeffs: CostCoeffs, is_packed: bool = False):
+    if np.ndim(qtile) or np.ndim(kv_tile) or np.ndim(is_packed):
+        # the njit kernels are scalar only, arrays take the NumPy path
+        metrics = softmax_vec(qtile, kv_tile, coeffs, is_packed)
+        return metrics, sum(metrics)
+    metrics, total = (_softmax_packed if is_packed else _softmax_unpacked)(qtile, kv_tile, coeffs.params)
+    return SoftmaxMetrics(*metrics), total
+
+
+def _softmax_total_vec(qtile, kv_tile, affine, is_packed):
+    inv_warp_size, a_packed, a_unpacked, b_packed, b_unpacked, c = affine
+    qtile = np.asarray(qtile, dtype=np.float64)
+    kv_tile = np.asarray(kv_tile, dtype=np.float64)
+    s_elems = (qtile * kv_tile) * inv_warp_size
+    a = np.where(is_packed, a_packed, a_unpacked)
+    b = np.where(is_packed, b_packed, b_unpacked)
+    return a * s_elems + b * qtile + c
+
+
+def softmax_total_fast(qtile, kv_tile, coeffs: CostCoeffs, is_packed=False):
+    """Sum of all ``softmax`` components, without the per-component breakdown."""
+    if np.ndim(is_packed):
+        # the njit kernel branches on a scalar is_packed
+        return _softmax_total_vec(qtile, kv_tile, coeffs.affine, is_packed)
+    return _softmax_total(qtile, kv_tile, coeffs.affine, is_packed)
+
+
+def total_cycles(qtile, kv_tile, coeffs: CostCoeffs, is_packed=False, co_exe=False):
+    """Total cycles of one tile config, without building the softmax breakdown."""
+    if np.ndim(is_packed) or np.ndim(co_exe):
+        # the njit kernel branches on scalar flags
+        gemm_cycles = gemm(qtile, kv_tile, coeffs)
+        # coexecution runs the unpacked softmax
+        is_packed = np.logical_and(is_packed, np.logical_not(co_exe))
+        softmax_total = _softmax_total_vec(qtile, kv_tile, coeffs.affine, is_packed)
+        return np.where(co_exe, CO_EXE_GEMM_COEF * gemm_cycles + 0.5 * softmax_total, gemm_cycles + softmax_total)
+    return _total_cycles(qtile, kv_tile, coeffs.gemm_params, coeffs.affine, is_packed, co_exe)
+
+
+def softmax_vec(qtile, kv_tile, coeffs: CostCoeffs, is_packed=False):
+    """Elementwise ``softmax`` over array-like (qtile, kv_tile, is_packed)."""
+    (inv_warp_size, vop_rate, exp_rate, cvt_rate,
+     inter_max_base, inter_max_per_qtile, out_lanes, reshape_base, reshape_rate) = coeffs.params
+
+    qtile = np.asarray(qtile, dtype=np.float64)
+    kv_tile = np.asarray(kv_tile, dtype=np.float64)
+    pack = np.where(is_packed, 0.5, 1.0)
+    s_elems = (qtile * kv_tile) * inv_warp_size
+    packed_elems = s_elems * pack
+    out_elems = (qtile * out_lanes) * inv_warp_size
+
+    return SoftmaxMetrics(
+        dequant=packed_elems * vop_rate,
+        intra_max=(s_elems * 0.5) * vop_rate,
+        inter_max=inter_max_base + qtile * inter_max_per_qtile,
+        softmax_fma_exp=packed_elems * vop_rate + s_elems * exp_rate,
+        softmax_sum=packed_elems * vop_rate,
+        s_quant=packed_elems * vop_rate + packed_elems * cvt_rate,
+        reshape_s=s_elems * reshape_rate + reshape_base,
+        recompute_output=(out_elems * pack) * 2 * vop_rate,
+    )
+
+
+@lru_cache(maxsize=None)
+def _make_printer(coeffs: CostCoeffs, is_packed, co_exe):
+    """Build a ``print_performance_table`` specialized for fixed (coeffs, is_packed, co_exe)."""
+
+    # models without an LDS reshape of s do not report it
+    names = [name for name in SoftmaxMetrics._fields if name != "reshape_s" or coeffs.has_reshape]
+
+    # 打印表格
+    lines = ["", "=" * 60]
+    lines.append(f"Performance Table: qtile={{qtile}}, kv_tile={{kv_tile}}, is_packed={is_packed}, co_exe={co_exe}")
+    lines.append("=" * 60)
+    lines.append(f"{'Component':<25} {'Cycles':<12}")
+    lines.append("-" * 60)
+    # GEMM
+    lines.append(f"{'GEMM':<25} {{gemm_cycles:<12.2f}}")
+    # Softmax各项
+    lines.append(f"{'Softmax Total':<25} {{softmax_total:<12.2f}}")
+    for name in names:
+        formatted_name = name.replace("_", " ").title()
+        lines.append(f"  {formatted_name:<23} {{{name}:<12.2f}}")
+    # total cycles
+    lines.append(f"{'Total Cycles':<25} {{tot_cycles:<12.2f}}")
+    if co_exe:
+        lines.append(f"{'Total Cycles for Coexecution':<25} {{tot_cycles_coexe:<12.2f}}")
+    lines.append("=" * 60)
+    template = "\n".join(lines) + "\n"
+
+    gemm_params = coeffs.gemm_params
+    params = coeffs.params
+    kernel = _softmax_packed if is_packed else _softmax_unpacked
+
+    def printer(qtile, kv_tile):
+        softmax_metrics, softmax_total = kernel(qtile, kv_tile, params)
+        gemm_cycles = _gemm(qtile, kv_tile, gemm_params[0], gemm_params[1])
+
+        values = dict(zip(SoftmaxMetrics._fields, softmax_metrics))
+        values["qtile"] = qtile
+        values["kv_tile"] = kv_tile
+        values["gemm_cycles"] = gemm_cycles
+        values["softmax_total"] = softmax_total
+        # compute total cycles
+        values["tot_cycles"] = gemm_cycles + softmax_total
+        if co_exe:
+            # compute total cycles for coexecution
+            values["tot_cycles_coexe"] = fma(gemm_cycles, CO_EXE_GEMM_COEF, 0.5 * softmax_total)
+
+        sys.stdout.write(template.format_map(values))
+
+    return printer
+
+
+def print_performance_table(qtile, kv_tile, coeffs: CostCoeffs, co_exe=False, is_packed=False):
+    """打印性能分析表格"""
+
+    # coexecution runs the unpacked softmax
+    _make_printer(coeffs, bool(is_packed) and not co_exe, bool(co_exe))(qtile, kv_tile)
+
+
+def print_performance_sweep(qtiles, kv_tiles, coeffs: CostCoeffs, co_exe=False, is_packed=False):
+    """Print total cycles for every (qtile, kv_tile) pair of the sweep."""
+
+    if co_exe:
+        is_packed = False
+
+    q, kv = np.meshgrid(np.asarray(qtiles), np.asarray(kv_tiles), indexing="ij")
+    q = q.ravel()
+    kv = kv.ravel()
+
+    gemm_cycles = gemm(q, kv, coeffs)
+    softmax_total = softmax_total_fast(q, kv, coeffs, is_packed)
+    tot_cycles = gemm_cycles + softmax_total
+    tot_cycles_coexe = CO_EXE_GEMM_COEF * gemm_cycles + 0.5 * softmax_total
+
+    lines = ["", "=" * 60]
+    lines.append(f"Performance Sweep: is_packed={is_packed}, co_exe={co_exe}")
+    lines.append("=" * 60)
+    header = f"{'qtile':<8} {'kv_tile':<8} {'GEMM':<12} {'Softmax':<12} {'Total':<12}"
+    if co_exe:
+        header += f" {'Coexe':<12}"
+    lines.append(header)
+    lines.append("-" * 60)
+
+    for i in range(q.size):
+        row = (f"{q[i]:<8} {kv[i]:<8} {gemm_cycles[i]:<12.2f} "
+               f"{softmax_total[i]:<12.2f} {tot_cycles[i]:<12.2f}")
+        if co_exe:
+            row += f" {tot_cycles_coexe[i]:<12.2f}"
+        lines.append(row)
+
+    lines.append("=" * 60)
+    sys.stdout.write("\n".join(lines) + "\n")
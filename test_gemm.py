@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+import gemm
+from gemm import TileConfig
+
+
+def test_batch_rejects_fractional_tile_sizes():
+    with pytest.raises(ValueError, match="tile_m must be divisible by 8, got 64.5"):
+        gemm.fp8fp8_tile_metrics_batch([64.5], [256], [128])
+    with pytest.raises(ValueError, match="tile_m must be divisible by 8, got 64.5"):
+        gemm.fp8fp8_tile_metrics(64.5, 256, 128)
+
+
+@pytest.mark.skipif(not gemm.HAS_PANDAS, reason="pandas not installed")
+def test_table_rejects_fractional_tile_sizes():
+    with pytest.raises(ValueError, match="tile_m must be divisible by 8"):
+        gemm.fp8fp8_table([TileConfig(64.5, 256, 128)])
+
+
+def test_tile_m_multiple_of_8():
+    metrics = dict(zip(gemm.ROW_ORDER, gemm.fp8fp8_tile_metrics(24, 16, 32)))
+    assert metrics["acc reg"] == 3.0
+    assert metrics["a regs"] == 6.0
+
+
+def test_batch_accepts_integral_floats():
+    batch = gemm.fp8fp8_tile_metrics_batch([64.0], [256.0], [128.0])
+    np.testing.assert_array_equal(batch[:, 0], gemm.fp8fp8_tile_metrics(64, 256, 128))
+
+
+TILE_GRID = [
+    (m, n, k)
+    for m in (8, 16, 24, 32, 48, 64, 128, 256)
+    for n in (16, 64, 128, 256, 512)
+    for k in (32, 64, 128, 256)
+]
+
+
+def test_batch_matches_python_model():
+    m, n, k = (np.array(x) for x in zip(*TILE_GRID))
+    batch = gemm.fp8fp8_tile_metrics_batch(m, n, k)
+    for i, tile in enumerate(TILE_GRID):
+        np.testing.assert_allclose(batch[:, i], gemm._fp8fp8_tile_metrics_py(*tile), rtol=1e-12)
+
+
+@pytest.mark.skipif(gemm.fp8fp8_tile_metrics_c is None, reason="gemm_kernels extension not built")
+def test_compiled_matches_python_model():
+    for tile in TILE_GRID:
+        np.testing.assert_allclose(
+            gemm.fp8fp8_tile_metrics_c(*tile), gemm._fp8fp8_tile_metrics_py(*tile), rtol=1e-12
+        )
+
+
+def test_large_tiles_stay_exact():
+    tile = (2**62, 256, 128)
+    expected = gemm._fp8fp8_tile_metrics_py(*tile)
+    assert tuple(gemm.fp8fp8_tile_metrics(*tile)) == pytest.approx(expected)
+    batch = gemm.fp8fp8_tile_metrics_batch([64, tile[0]], [256, tile[1]], [128, tile[2]])
+    assert tuple(batch[:, 1]) == pytest.approx(expected)
+    assert tuple(batch[:, 0]) == pytest.approx(gemm._fp8fp8_tile_metrics_py(64, 256, 128))
+
+
+@pytest.mark.skipif(not gemm.HAS_PANDAS, reason="pandas not installed")
+def test_table_large_tiles_stay_exact():
+    cfg = TileConfig(2**62, 256, 128)
+    table = gemm.fp8fp8_table([cfg])
+    assert tuple(table[cfg.name]) == pytest.approx(gemm._fp8fp8_tile_metrics_py(cfg.m, cfg.n, cfg.k))
@@ -0,0 +1,52 @@
+import importlib.util
+import os
+
+import numpy as np
+import pytest
+
+import pa
+import pa_model
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _load_400_pa():
+    spec = importlib.util.spec_from_file_location("pa_400", os.path.join(_HERE, "400", "pa.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+COEFFS = [pa.COEFFS, _load_400_pa().COEFFS]
+QTILES = (16, 32, 48, 64)
+KV_TILES = (16, 32, 64, 128, 256)
+
+
+@pytest.mark.parametrize("coeffs", COEFFS)
+@pytest.mark.parametrize("is_packed", [False, True])
+def test_softmax_total_fast_matches_softmax(coeffs, is_packed):
+    for qtile in QTILES:
+        for kv_tile in KV_TILES:
+            fast = pa_model.softmax_total_fast(qtile, kv_tile, coeffs, is_packed)
+            full = pa_model.softmax(qtile, kv_tile, coeffs, is_packed)[1]
+            assert fast == pytest.approx(full, rel=1e-12, abs=1e-9)
+
+
+@pytest.mark.parametrize("coeffs", COEFFS)
+def test_softmax_total_fast_array_is_packed(coeffs):
+    q, kv = np.meshgrid(QTILES, KV_TILES, indexing="ij")
+    is_packed = (q // 16) % 2 == 0
+    fast = pa_model.softmax_total_fast(q, kv, coeffs, is_packed)
+    full = pa_model.softmax(q, kv, coeffs, is_packed)[1]
+    np.testing.assert_allclose(fast, full, rtol=1e-12, atol=1e-9)
+
+
+@pytest.mark.parametrize("coeffs", COEFFS)
+def test_total_cycles_array_flags(coeffs):
+    q, kv = np.meshgrid(QTILES, KV_TILES, indexing="ij")
+    is_packed = (q // 16) % 2 == 0
+    co_exe = kv >= 64
+    vec = pa_model.total_cycles(q, kv, coeffs, is_packed, co_exe)
+    for i in np.ndindex(q.shape):
+        scalar = pa_model.total_cycles(int(q[i]), int(kv[i]), coeffs, bool(is_packed[i]), bool(co_exe[i]))
+        assert vec[i] == pytest.approx(scalar, rel=1e-12)